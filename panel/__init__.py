@@ -1,19 +1,88 @@
-from . import layout # noqa
-from . import links # noqa
-from . import pane # noqa
-from . import param # noqa
-from . import pipeline # noqa
-from . import widgets # noqa
+"""
+Panel is a high-level app and dashboarding solution for Python.
+
+To keep `import panel` cheap only the config, the extension and the
+version are imported eagerly, all other components are imported on
+first access using a module level __getattr__ (see PEP 562).
+"""
+import sys
+
+from importlib import import_module
+from types import ModuleType
 
 from .config import config, panel_extension as extension, __version__ # noqa
-from .depends import bind, depends # noqa
-from .interact import interact # noqa
-from .io import _jupyter_server_extension_paths, ipywidget, serve, state # noqa
-from .layout import ( # noqa
-    Accordion, Card, Column, GridSpec, GridBox, FlexBox, Tabs, Row,
-    Spacer, WidgetBox
-)
-from .pane import panel, Pane # noqa
-from .param import Param # noqa
-from .template import Template # noqa
-from .widgets import indicators # noqa
+
+# Maps each lazily loaded name to the submodule defining it, submodules
+# themselves map to None.
+_LAZY_IMPORTS = {
+    'compiler': None,
+    'io': None,
+    'layout': None,
+    'links': None,
+    'models': None,
+    'pane': None,
+    'param': None,
+    'pipeline': None,
+    'reactive': None,
+    'template': None,
+    'util': None,
+    'viewable': None,
+    'widgets': None,
+    'bind': 'depends',
+    'depends': 'depends',
+    'interact': 'interact',
+    '_jupyter_server_extension_paths': 'io',
+    'ipywidget': 'io',
+    'serve': 'io',
+    'state': 'io',
+    'Accordion': 'layout',
+    'Card': 'layout',
+    'Column': 'layout',
+    'GridSpec': 'layout',
+    'GridBox': 'layout',
+    'FlexBox': 'layout',
+    'Tabs': 'layout',
+    'Row': 'layout',
+    'Spacer': 'layout',
+    'WidgetBox': 'layout',
+    'panel': 'pane',
+    'Pane': 'pane',
+    'Param': 'param',
+    'Template': 'template',
+    'indicators': 'widgets',
+}
+
+# Submodules which define a function of the same name, the package
+# attribute should always refer to the function.
+_SHADOWED = ('depends', 'interact')
+
+__all__ = ['config', 'extension', '__version__'] + list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = _LAZY_IMPORTS[name]
+    if module is None:
+        value = import_module(f'{__name__}.{name}')
+    else:
+        value = getattr(import_module(f'{__name__}.{module}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+class _PanelModule(ModuleType):
+
+    def __setattr__(self, name, value):
+        # The import system binds submodules onto the package after
+        # they are first imported, which would shadow the function
+        if name in _SHADOWED and isinstance(value, ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _PanelModule
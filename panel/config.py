@@ -267,6 +267,8 @@ class _config(_base_config):
         return value if value else 'disable'
 
     def _template_hook(self, value):
+        # Importing panel.template populates the template names
+        from . import template # noqa
         if isinstance(value, str):
             return self.param.template.names[value]
         return value
@@ -518,6 +520,10 @@ class panel_extension(_pyviz_extension):
     def _apply_signatures(self):
         from inspect import Parameter, Signature
         from .viewable import Viewable
+        # Ensure all lazily loaded components are defined
+        from . import layout, pane, template, widgets # noqa
+        from .interact import interactive # noqa
+        from .param import Param # noqa
 
         descendants = param.concrete_descendents(Viewable)
         for cls in reversed(list(descendants.values())):
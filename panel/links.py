@@ -15,7 +15,6 @@ from bokeh.models import ColumnDataSource, CustomJS, Model as BkModel
 from .config import config
 from .io.notebook import push_on_root
 from .models import ReactiveHTML
-from .reactive import Reactive, Syncable
 from .viewable import Viewable
 
 
@@ -91,6 +90,7 @@ def construct_data_model(parameterized, name=None, ignore=[], types={}):
     -------
     DataModel
     """
+    from .reactive import Syncable
 
     properties = {}
     for pname in parameterized.param:
@@ -579,6 +579,8 @@ class JSCallbackGenerator(CallbackGenerator):
         return [src_spec[1]], []
 
     def _get_specs(self, link, source, target):
+        from .reactive import Reactive
+
         for src_spec, code in link.code.items():
             src_specs = src_spec.split('.')
             if src_spec.startswith('event:'):
@@ -660,6 +662,8 @@ class JSLinkCallbackGenerator(JSCallbackGenerator):
     """
 
     def _get_specs(self, link, source, target):
+        from .reactive import Reactive
+
         if link.code:
             return super()._get_specs(link, source, target)
 
@@ -721,6 +725,8 @@ class JSLinkCallbackGenerator(JSCallbackGenerator):
             references[k[7:]] = references.pop(k)
 
     def _get_code(self, link, source, src_spec, target, tgt_spec):
+        from .reactive import Reactive
+
         if isinstance(source, Reactive):
             src_reverse = {v: k for k, v in source._rename.items()}
             src_param = src_reverse.get(src_spec, src_spec)
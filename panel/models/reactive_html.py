@@ -12,9 +12,10 @@ from bokeh.events import ModelEvent
 
 
 endfor = '{% endfor %}'
-list_iter_re = r'{% for (\s*[A-Za-z_]\w*\s*) in (\s*[A-Za-z_]\w*\s*) %}'
-items_iter_re = r'{% for \s*[A-Za-z_]\w*\s*, (\s*[A-Za-z_]\w*\s*) in (\s*[A-Za-z_]\w*\s*)\.items\(\) %}'
-values_iter_re = r'{% for (\s*[A-Za-z_]\w*\s*) in (\s*[A-Za-z_]\w*\s*)\.values\(\) %}'
+list_iter_re = re.compile(r'{% for (\s*[A-Za-z_]\w*\s*) in (\s*[A-Za-z_]\w*\s*) %}')
+items_iter_re = re.compile(r'{% for \s*[A-Za-z_]\w*\s*, (\s*[A-Za-z_]\w*\s*) in (\s*[A-Za-z_]\w*\s*)\.items\(\) %}')
+values_iter_re = re.compile(r'{% for (\s*[A-Za-z_]\w*\s*) in (\s*[A-Za-z_]\w*\s*)\.values\(\) %}')
+template_re = re.compile(r'\$\{[^}]+\}')
 
 
 class ReactiveHTMLParser(HTMLParser):
@@ -27,7 +28,6 @@ class ReactiveHTMLParser(HTMLParser):
         self.children = {}
         self.nodes = []
         self.looped = []
-        self._template_re = re.compile(r'\$\{[^}]+\}')
         self._current_node = None
         self._node_stack = []
         self._open_for = False
@@ -44,7 +44,7 @@ class ReactiveHTMLParser(HTMLParser):
                 if value is None:
                     continue
                 params, methods = [], []
-                for match in self._template_re.findall(value):
+                for match in template_re.findall(value):
                     match = match[2:-1]
                     if match.startswith('model.'):
                         continue
@@ -81,7 +81,7 @@ class ReactiveHTMLParser(HTMLParser):
             if value is None:
                 continue
             matches = []
-            for match in self._template_re.findall(value):
+            for match in template_re.findall(value):
                 if not match[2:-1].startswith('model.'):
                     matches.append(match[2:-1])
             if matches:
@@ -98,26 +98,27 @@ class ReactiveHTMLParser(HTMLParser):
         dom_id = self._current_node
         matches = [
             '%s}]}' % match if match.endswith('.index0 }') else match
-            for match in self._template_re.findall(data)
+            for match in template_re.findall(data)
         ]
 
-        # Detect templating for loops
-        list_loop = re.findall(list_iter_re, data)
-        values_loop = re.findall(values_iter_re, data)
-        items_loop = re.findall(items_iter_re, data)
-        nloops = len(list_loop) + len(values_loop) + len(items_loop)
-        if nloops > 1 and nloops and self._open_for:
-            raise ValueError('Nested for loops currently not supported in templates.')
-        elif nloops:
-            loop = [loop for loop in (list_loop, values_loop, items_loop) if loop][0]
-            var, obj = loop[0]
-            if var in self.cls.param:
-                raise ValueError(f'Loop variable {var} clashes with parameter name. '
-                                 'Ensure loop variables have a unique name. Relevant '
-                                 f'template section:\n\n{data}')
-            self.loop_map[var] = obj
-
+        # Detect templating for loops, the loop regexes can only match
+        # if the data contains a for statement
+        nloops = 0
         if '{% for ' in data:
+            list_loop = list_iter_re.findall(data)
+            values_loop = values_iter_re.findall(data)
+            items_loop = items_iter_re.findall(data)
+            nloops = len(list_loop) + len(values_loop) + len(items_loop)
+            if nloops > 1 and nloops and self._open_for:
+                raise ValueError('Nested for loops currently not supported in templates.')
+            elif nloops:
+                loop = [loop for loop in (list_loop, values_loop, items_loop) if loop][0]
+                var, obj = loop[0]
+                if var in self.cls.param:
+                    raise ValueError(f'Loop variable {var} clashes with parameter name. '
+                                     'Ensure loop variables have a unique name. Relevant '
+                                     f'template section:\n\n{data}')
+                self.loop_map[var] = obj
             self._open_for = True
         if endfor in data and (not nloops or data.index(endfor) > data.index('{% for ')):
             self._open_for = False
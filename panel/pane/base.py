@@ -16,6 +16,20 @@ from ..reactive import Reactive
 from ..viewable import Layoutable, Viewable, Viewer
 from ..util import param_reprs
 
+# Whether the modules defining panes outside of panel.pane are loaded
+_panes_registered = False
+
+
+def _register_panes():
+    """
+    Imports the modules defining the Param and interact panes, which
+    cannot be imported by panel.pane itself without circular imports.
+    """
+    global _panes_registered
+    from ..interact import interactive # noqa
+    from ..param import ParamMethod # noqa
+    _panes_registered = True
+
 
 def Pane(obj, **kwargs):
     """
@@ -290,6 +304,8 @@ class PaneBase(Reactive):
         """
         if isinstance(obj, Viewable):
             return type(obj)
+        if not _panes_registered:
+            _register_panes()
         descendents = []
         for p in param.concrete_descendents(PaneBase).values():
             if p.priority is None:
@@ -8,6 +8,11 @@ from pyviz_comms import JupyterComm
 from ..util import lazy_load
 from .base import PaneBase
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 
 class ECharts(PaneBase):
     """
@@ -31,14 +36,34 @@ class ECharts(PaneBase):
 
     _updates = True
 
+    # Bokeh model class, resolved on first render
+    _model_cls = None
+
+    # Base class of all pyecharts charts, resolved on first use
+    _pyecharts_base = None
+
+    def __init__(self, object=None, **params):
+        super().__init__(object, **params)
+        self._echart_cache = (None, None)
+
     @classmethod
     def applies(cls, obj, **params):
         if isinstance(obj, dict):
             return 0
-        elif "pyecharts." in repr(obj.__class__):
+        elif cls.is_pyecharts(obj):
             return 0.8
         return None
 
+    @classmethod
+    def is_pyecharts(cls, obj):
+        base = ECharts._pyecharts_base
+        if base is None:
+            if 'pyecharts' not in sys.modules:
+                return False
+            from pyecharts.charts.base import Base  # pylint: disable=import-outside-toplevel,import-error
+            ECharts._pyecharts_base = base = Base
+        return isinstance(obj, base)
+
     @classmethod
     def _get_dimensions(cls, props):
         if json is None:
@@ -50,11 +75,20 @@ class ECharts(PaneBase):
             props['sizing_mode'] = 'fixed'
 
     def _get_model(self, doc, root=None, parent=None, comm=None):
-        ECharts = lazy_load('panel.models.echarts', 'ECharts', isinstance(comm, JupyterComm), root)
-        props = self._get_echart_dict(self.object)
-        props.update(self._process_param_change(self._init_params()))
+        if ECharts._model_cls is None:
+            ECharts._model_cls = lazy_load(
+                'panel.models.echarts', 'ECharts', isinstance(comm, JupyterComm), root
+            )
+        # The chart is serialized both for the props and the init params,
+        # cache it for the duration of this model build only
+        self._echart_cache = (None, None)
+        try:
+            props = self._get_echart_dict(self.object)
+            props.update(self._process_param_change(self._init_params()))
+        finally:
+            self._echart_cache = (None, None)
         self._get_dimensions(props)
-        model = ECharts(**props)
+        model = ECharts._model_cls(**props)
         if root is None:
             root = model
         self._models[root.ref['id']] = (model, parent)
@@ -69,14 +103,16 @@ class ECharts(PaneBase):
     def _get_echart_dict(self, object):
         if isinstance(object, dict):
             return {'data': dict(object)}
-        elif "pyecharts" in sys.modules:
-            import pyecharts  # pylint: disable=import-outside-toplevel,import-error
-            if isinstance(object, pyecharts.charts.chart.Chart):
-                w, h = object.width, object.height
-                params = {'data': json.loads(object.dump_options())}
-                if not self.height and h:
-                    params['height'] = int(h.replace('px', ''))
-                if not self.width and w:
-                    params['width'] = int(w.replace('px', ''))
-                return params
+        elif self.is_pyecharts(object):
+            w, h = object.width, object.height
+            obj_id, data = self._echart_cache
+            if obj_id != id(object):
+                data = json_loads(object.dump_options())
+                self._echart_cache = (id(object), data)
+            params = {'data': dict(data)}
+            if not self.height and h:
+                params['height'] = int(h.replace('px', ''))
+            if not self.width and w:
+                params['width'] = int(w.replace('px', ''))
+            return params
         return {}
@@ -16,7 +16,7 @@ from bokeh.themes.theme import Theme
 from ..io import state, unlocked
 from ..layout import Column, WidgetBox, HSpacer, VSpacer, Row
 from ..viewable import Layoutable, Viewable
-from ..widgets import Player
+from ..widgets.player import Player
 from .base import PaneBase, Pane, RerenderError
 from .plot import Bokeh, Matplotlib
 from .plotly import Plotly
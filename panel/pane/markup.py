@@ -3,17 +3,83 @@ Pane class which render various markup languages including HTML,
 Markdown, and also regular strings.
 """
 import json
+import re
 import textwrap
 
+from functools import lru_cache
+from weakref import WeakKeyDictionary
+
 from six import string_types
 
 import param
 
+from ..io.model import hold
 from ..models import HTML as _BkHTML, JSON as _BkJSON
 from ..util import escape
 from ..viewable import Layoutable
 from .base import PaneBase
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    from markupsafe import escape as _markup_escape
+
+    def _escape_str(text):
+        # Single pass escape, str() avoids returning a Markup object
+        return str(_markup_escape(text))
+except ImportError:
+    _escape_str = escape
+
+# Properties shared by all Div based panes
+_DIV_PROPERTIES = tuple(Layoutable.param) + ('style',)
+
+# Type names of the DataFrame-like objects rendered by the HTML and
+# DataFrame panes, checked before the (slower) module name scan
+_HTML_DF_TYPES = frozenset(['DataFrame', 'Series'])
+_DF_TYPES = frozenset(['DataFrame', 'Series', 'Random', 'DataFrames', 'Seriess'])
+
+# Per-type caches of the DataFrame-like checks above
+_HTML_DF_CACHE = WeakKeyDictionary()
+_DF_CACHE = WeakKeyDictionary()
+
+# Matches if the first non-blank line is indented, otherwise dedenting
+# is a no-op
+_INDENTED_RE = re.compile(r'(?:[ \t]*\n)*[ \t]+[^ \t\n]')
+
+
+def _is_dataframe_like(obj, names, modules, cache):
+    """
+    Whether the object is of one of the named types defined in one of
+    the modules, memoized per type.
+    """
+    obj_type = type(obj)
+    is_df = cache.get(obj_type)
+    if is_df is None:
+        module = getattr(obj, '__module__', '')
+        is_df = obj_type.__name__ in names and any(m in module for m in modules)
+        cache[obj_type] = is_df
+    return is_df
+
+
+# The markdown module, imported on first render
+_markdown = None
+
+
+@lru_cache(maxsize=128)
+def _render_markdown(data, extensions):
+    """
+    Renders markdown to HTML, memoized on the markdown text and the
+    tuple of extensions.
+    """
+    global _markdown
+    if _markdown is None:
+        import markdown as _markdown
+    return _markdown.markdown(data, extensions=list(extensions),
+                              output_format='html5')
+
 
 class DivPaneBase(PaneBase):
     """
@@ -34,8 +100,12 @@ class DivPaneBase(PaneBase):
     __abstract = True
 
     def _get_properties(self):
-        return {p : getattr(self, p) for p in list(Layoutable.param) + ['style']
-                if getattr(self, p) is not None}
+        properties = {}
+        for p in _DIV_PROPERTIES:
+            value = getattr(self, p)
+            if value is not None:
+                properties[p] = value
+        return properties
 
     def _get_model(self, doc, root=None, parent=None, comm=None):
         model = self._bokeh_model(**self._get_properties())
@@ -45,7 +115,12 @@ class DivPaneBase(PaneBase):
         return model
 
     def _update(self, ref=None, model=None):
-        model.update(**self._get_properties())
+        props = self._get_properties()
+        if model.document is None:
+            model.update(**props)
+        else:
+            with hold(model.document):
+                model.update(**props)
 
 
 class HTML(DivPaneBase):
@@ -66,9 +141,8 @@ class HTML(DivPaneBase):
 
     @classmethod
     def applies(cls, obj):
-        module, name = getattr(obj, '__module__', ''), type(obj).__name__
-        if ((any(m in module for m in ('pandas', 'dask')) and
-            name in ('DataFrame', 'Series')) or hasattr(obj, '_repr_html_')):
+        if (_is_dataframe_like(obj, _HTML_DF_TYPES, ('pandas', 'dask'), _HTML_DF_CACHE) or
+            hasattr(obj, '_repr_html_')):
             return 0.2
         elif isinstance(obj, string_types):
             return None
@@ -77,9 +151,13 @@ class HTML(DivPaneBase):
 
     def _get_properties(self):
         properties = super()._get_properties()
-        text = '' if self.object is None else self.object
-        if hasattr(text, '_repr_html_'):
-            text = text._repr_html_()
+        text = self.object
+        if text is None:
+            text = ''
+        elif type(text) is not str:
+            repr_html = getattr(text, '_repr_html_', None)
+            if repr_html is not None:
+                text = repr_html()
         return dict(properties, text=escape(text))
 
 
@@ -165,6 +243,12 @@ class DataFrame(HTML):
         'sparsify', 'sizing_mode'
     ]
 
+    # Parameters forwarded to the to_html method of the DataFrame
+    _to_html_params = tuple(
+        p for p in _rerender_params
+        if p not in DivPaneBase.param and p != '_object'
+    )
+
     def __init__(self, object=None, **params):
         super().__init__(object, **params)
         self._stream = None
@@ -172,10 +256,7 @@ class DataFrame(HTML):
 
     @classmethod
     def applies(cls, obj):
-        module = getattr(obj, '__module__', '')
-        name = type(obj).__name__
-        if (any(m in module for m in ('pandas', 'dask', 'streamz')) and
-            name in ('DataFrame', 'Series', 'Random', 'DataFrames', 'Seriess')):
+        if _is_dataframe_like(obj, _DF_TYPES, ('pandas', 'dask', 'streamz'), _DF_CACHE):
             return 0.3
         else:
             return False
@@ -218,8 +299,7 @@ class DataFrame(HTML):
             if 'dask' in module:
                 html = df.to_html(max_rows=self.max_rows).replace('border="1"', '')
             else:
-                kwargs = {p: getattr(self, p) for p in self._rerender_params
-                          if p not in DivPaneBase.param and p != '_object'}
+                kwargs = {p: getattr(self, p) for p in self._to_html_params}
                 html = df.to_html(**kwargs)
         else:
             html = ''
@@ -237,7 +317,7 @@ class Str(DivPaneBase):
 
     priority = 0
 
-    _target_transforms = {'object': """JSON.stringify(value).replace(/,/g, ", ").replace(/:/g, ": ")"""}
+    _target_transforms = {'object': """JSON.stringify(value).replace(/([,:])/g, "$1 ")"""}
 
     _bokeh_model = _BkHTML
 
@@ -250,8 +330,10 @@ class Str(DivPaneBase):
         if self.object is None:
             text = ''
         else:
-            text = '<pre>'+str(self.object)+'</pre>'
-        return dict(properties, text=escape(text))
+            # Equivalent to escaping the wrapped string but avoids
+            # escaping the constant <pre> tags on every render
+            text = '&lt;pre&gt;' + _escape_str(str(self.object)) + '&lt;/pre&gt;'
+        return dict(properties, text=text)
 
 
 class Markdown(DivPaneBase):
@@ -290,19 +372,17 @@ class Markdown(DivPaneBase):
             return False
 
     def _get_properties(self):
-        import markdown
         data = self.object
         if data is None:
             data = ''
         elif not isinstance(data, string_types):
             data = data._repr_markdown_()
-        if self.dedent:
+        if self.dedent and _INDENTED_RE.match(data):
             data = textwrap.dedent(data)
         properties = super()._get_properties()
         properties['style'] = properties.get('style', {})
         css_classes = properties.pop('css_classes', []) + ['markdown']
-        html = markdown.markdown(data, extensions=self.extensions,
-                                 output_format='html5')
+        html = _render_markdown(data, tuple(self.extensions))
         return dict(properties, text=escape(html), css_classes=css_classes)
 
 
@@ -350,11 +430,17 @@ class JSON(DivPaneBase):
 
     def _get_properties(self):
         properties = super()._get_properties()
-        try:
-            data = json.loads(self.object)
-        except Exception:
-            data = self.object
-        text = json.dumps(data or {}, cls=self.encoder)
+        obj = self.object
+        if isinstance(obj, (bytes, bytearray)):
+            obj = obj.decode('utf-8')
+        if isinstance(obj, string_types):
+            # Valid JSON strings are passed through without re-encoding
+            try:
+                text = obj if json_loads(obj) else '{}'
+            except Exception:
+                text = json.dumps(obj, cls=self.encoder)
+        else:
+            text = json.dumps(obj or {}, cls=self.encoder)
         depth = None if self.depth < 0 else self.depth
         return dict(text=text, theme=self.theme, depth=depth,
                     hover_preview=self.hover_preview, **properties)
@@ -12,7 +12,7 @@ import textwrap
 import threading
 
 from collections import Counter, defaultdict, namedtuple
-from functools import partial
+from functools import lru_cache, partial
 
 import bleach
 import numpy as np
@@ -37,6 +37,30 @@ from .viewable import Layoutable, Renderable, Viewable
 LinkWatcher = namedtuple("Watcher", Watcher._fields+('target', 'links', 'transformed', 'bidirectional_watcher'))
 
 
+class _PropertyChangeCallback:
+    """
+    Callback registered on each linked bokeh model property, forwards
+    property changes to the _comm_change or _server_change method of
+    the Syncable. Uses slots since one instance is created for every
+    linked property on every model.
+    """
+
+    __slots__ = ('obj', 'doc', 'ref', 'comm', 'subpath')
+
+    def __init__(self, obj, doc, ref, comm, subpath):
+        self.obj = obj
+        self.doc = doc
+        self.ref = ref
+        self.comm = comm
+        self.subpath = subpath
+
+    def __call__(self, attr, old, new):
+        if self.comm:
+            self.obj._comm_change(self.doc, self.ref, self.comm, self.subpath, attr, old, new)
+        else:
+            self.obj._server_change(self.doc, self.ref, self.subpath, attr, old, new)
+
+
 class Syncable(Renderable):
     """
     Syncable is an extension of the Renderable object which can not
@@ -65,6 +89,9 @@ class Syncable(Renderable):
     # Mapping from parameter name to bokeh model property name
     _rename = {}
 
+    # Inverse of the _rename mapping, computed once per class
+    _rename_inverse = {}
+
     # Allows defining a mapping from model property name to a JS code
     # snippet that transforms the object before serialization
     _js_transforms = {}
@@ -75,6 +102,10 @@ class Syncable(Renderable):
 
     __abstract = True
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._rename_inverse = {v: k for k, v in cls._rename.items()}
+
     def __init__(self, **params):
         super().__init__(**params)
 
@@ -108,7 +139,7 @@ class Syncable(Renderable):
         _rename class level attribute to map between parameter and
         property names.
         """
-        inverted = {v: k for k, v in self._rename.items()}
+        inverted = self._rename_inverse
         return {inverted.get(k, k): v for k, v in msg.items()}
 
     def _process_param_change(self, msg):
@@ -170,10 +201,7 @@ class Syncable(Renderable):
                     m = getattr(m, sp)
             else:
                 subpath = None
-            if comm:
-                m.on_change(p, partial(self._comm_change, doc, ref, comm, subpath))
-            else:
-                m.on_change(p, partial(self._server_change, doc, ref, subpath))
+            m.on_change(p, _PropertyChangeCallback(self, doc, ref, comm, subpath))
 
     def _manual_update(self, events, model, doc, root, parent, comm):
         """
@@ -1023,6 +1051,16 @@ class ReactiveData(SyncableData):
 
 
 
+@lru_cache(maxsize=128)
+def _compile_template(template_string):
+    """
+    Compiles a Jinja2 template, memoized since all instances of a
+    ReactiveHTML class share the same template string.
+    """
+    import jinja2
+    return jinja2.Template(template_string)
+
+
 class ReactiveHTMLMetaclass(ParameterizedMetaclass):
     """
     Parses the ReactiveHTML._template of the class and initializes
@@ -1032,7 +1070,7 @@ class ReactiveHTMLMetaclass(ParameterizedMetaclass):
 
     _name_counter = Counter()
 
-    _script_regex = r"script\([\"|'](.*)[\"|']\)"
+    _script_regex = re.compile(r"script\([\"|'](.*)[\"|']\)")
 
     def __init__(mcs, name, bases, dict_):
         from .links import PARAM_MAPPING, construct_data_model
@@ -1083,8 +1121,8 @@ class ReactiveHTMLMetaclass(ParameterizedMetaclass):
                 for p in parameters:
                     if p in mcs.param or '.' in p:
                         param_attrs.append(p)
-                    elif re.match(mcs._script_regex, p):
-                        name = re.findall(mcs._script_regex, p)[0]
+                    elif mcs._script_regex.match(p):
+                        name = mcs._script_regex.findall(p)[0]
                         if name not in mcs._scripts:
                             raise ValueError(
                                 f"{cls_name}._template inline callback "
@@ -1265,7 +1303,7 @@ class ReactiveHTML(Reactive, metaclass=ReactiveHTMLMetaclass):
 
     _scripts = {}
 
-    _script_assignment = r'data\.([^[^\d\W]\w*)[ ]*[\+,\-,\*,\\,%,\*\*,<<,>>,>>>,&,\^,|,\&\&,\|\|,\?\?]*='
+    _script_assignment = re.compile(r'data\.([^[^\d\W]\w*)[ ]*[\+,\-,\*,\\,%,\*\*,<<,>>,>>>,&,\^,|,\&\&,\|\|,\?\?]*=')
 
     __abstract = True
 
@@ -1439,8 +1477,6 @@ class ReactiveHTML(Reactive, metaclass=ReactiveHTMLMetaclass):
         return self._process_children(doc, root, model, comm, new_models)
 
     def _get_template(self):
-        import jinja2
-
         # Replace loop variables with indexed child parameter e.g.:
         #   {% for obj in objects %}
         #     ${obj}
@@ -1465,7 +1501,7 @@ class ReactiveHTML(Reactive, metaclass=ReactiveHTMLMetaclass):
                     f"id='{dom_node}'", replacement)
 
         # Render Jinja template
-        template = jinja2.Template(template_string)
+        template = _compile_template(template_string)
         context = {'param': self.param, '__doc__': self.__original_doc__, 'id': id}
         for parameter, value in self.param.values().items():
             context[parameter] = value
@@ -1507,7 +1543,7 @@ class ReactiveHTML(Reactive, metaclass=ReactiveHTMLMetaclass):
             if not isinstance(scripts, list):
                 scripts = [scripts]
             for script in scripts:
-                for p in re.findall(self._script_assignment, script):
+                for p in self._script_assignment.findall(script):
                     if p not in linked_properties:
                         linked_properties.append(p)
         for children_param in self._parser.children.values():
@@ -237,7 +237,7 @@ def test_embed_select_str_jslink(document, comm):
     assert cb1.code == """
     var value = source['value'];
     value = value;
-    value = JSON.stringify(value).replace(/,/g, ", ").replace(/:/g, ": ");
+    value = JSON.stringify(value).replace(/([,:])/g, "$1 ");
     try {
       var property = target.properties['text'];
       if (property !== undefined) { property.validate(value); }
@@ -314,7 +314,7 @@ def test_embed_checkbox_str_jslink(document, comm):
     assert cb1.code == """
     var value = source['active'];
     value = value.indexOf(0) >= 0;
-    value = JSON.stringify(value).replace(/,/g, ", ").replace(/:/g, ": ");
+    value = JSON.stringify(value).replace(/([,:])/g, "$1 ");
     try {
       var property = target.properties['text'];
       if (property !== undefined) { property.validate(value); }
@@ -392,7 +392,7 @@ def test_embed_slider_str_jslink(document, comm):
     assert cb1.code == """
     var value = source['value'];
     value = value;
-    value = JSON.stringify(value).replace(/,/g, ", ").replace(/:/g, ": ");
+    value = JSON.stringify(value).replace(/([,:])/g, "$1 ");
     try {
       var property = target.properties['text'];
       if (property !== undefined) { property.validate(value); }
@@ -1,3 +1,5 @@
+import pytest
+
 import panel as pn
 
 ECHART = {
@@ -20,6 +22,46 @@ def test_echart():
     assert pane.object == echart
     return pane
 
+def test_pyechart_updates_on_trigger(document, comm):
+    pytest.importorskip('pyecharts')
+    from pyecharts.charts import Bar
+
+    bar = Bar().add_xaxis(['A', 'B']).add_yaxis('Series1', [1, 2])
+    pane = pn.pane.ECharts(bar)
+    model = pane.get_root(document, comm=comm)
+    assert len(model.data['series']) == 1
+
+    bar.add_yaxis('Series2', [3, 4])
+    pane.param.trigger('object')
+    assert len(model.data['series']) == 2
+
+    pane.object = Bar().add_xaxis(['A']).add_yaxis('Series1', [1])
+    assert model.data['xAxis'][0]['data'] == ['A']
+
+def test_pyechart_rerender_after_inplace_change(document, comm):
+    pytest.importorskip('pyecharts')
+    from bokeh.document import Document
+    from pyecharts.charts import Bar
+
+    bar = Bar().add_xaxis(['A', 'B']).add_yaxis('Series1', [1, 2])
+    pane = pn.pane.ECharts(bar)
+    model = pane.get_root(document, comm=comm)
+    assert len(model.data['series']) == 1
+
+    bar.add_yaxis('Series2', [3, 4])
+    model = pane.get_root(Document(), comm=comm)
+    assert len(model.data['series']) == 2
+
+def test_pyechart_applies():
+    pytest.importorskip('pyecharts')
+    from pyecharts.charts import Bar, Grid
+    from pyecharts import options as opts
+
+    bar = Bar().add_xaxis(['A', 'B']).add_yaxis('Series1', [1, 2])
+    assert pn.pane.ECharts.applies(bar) == 0.8
+    assert pn.pane.ECharts.applies(Grid().add(bar, grid_opts=opts.GridOpts())) == 0.8
+    assert pn.pane.ECharts.applies(opts.TitleOpts()) is None
+
 def get_pyechart():
     from pyecharts.charts import Bar
     from pyecharts import options as opts
@@ -76,6 +76,16 @@ def test_markdown_pane_dedent(document, comm):
     assert model.text.startswith('&lt;div class=&quot;codehilite')
 
 
+def test_markdown_pane_dedent_leading_blank_lines(document, comm):
+    pane = Pane("\n  \n    ABC\n    DEF")
+
+    model = pane.get_root(document, comm=comm)
+    assert model.text.endswith("&lt;p&gt;ABC\nDEF&lt;/p&gt;")
+
+    pane.object = "ABC\n    DEF"
+    assert model.text.endswith("&lt;p&gt;ABC\n    DEF&lt;/p&gt;")
+
+
 def test_markdown_pane_extensions(document, comm):
     pane = Pane("""
     ```python
@@ -92,6 +102,18 @@ def test_markdown_pane_extensions(document, comm):
     assert model.text.startswith('&lt;pre&gt;&lt;code class=&quot;language-python')
 
 
+def test_markdown_pane_render_cached(document, comm):
+    from panel.pane.markup import _render_markdown
+
+    pane = Markdown("**Cached**")
+    model = pane.get_root(document, comm=comm)
+
+    hits = _render_markdown.cache_info().hits
+    pane.css_classes = ['custom']
+    assert _render_markdown.cache_info().hits == hits + 1
+    assert model.text.endswith("&lt;p&gt;&lt;strong&gt;Cached&lt;/strong&gt;&lt;/p&gt;")
+
+
 def test_html_pane(document, comm):
     pane = HTML("<h1>Test</h1>")
 
@@ -110,6 +132,20 @@ def test_html_pane(document, comm):
     assert pane._models == {}
 
 
+def test_html_pane_repr_html(document, comm):
+    class ReprHTML:
+        def _repr_html_(self):
+            return "<h1>Test</h1>"
+
+    pane = HTML(ReprHTML())
+
+    model = pane.get_root(document, comm=comm)
+    assert model.text == "&lt;h1&gt;Test&lt;/h1&gt;"
+
+    pane.object = None
+    assert model.text == ""
+
+
 @pd_available
 def test_dataframe_pane_pandas(document, comm):
     import pandas as pd
@@ -246,6 +282,28 @@ def test_json_pane(document, comm):
     assert pane._models == {}
 
 
+def test_json_pane_string_passthrough(document, comm):
+    pane = JSON('{"a":[1,2]}')
+
+    model = pane.get_root(document, comm=comm)
+    assert model.text == '{"a":[1,2]}'
+
+    pane.object = '{not json'
+    assert model.text == '"{not json"'
+
+    pane.object = '[]'
+    assert model.text == '{}'
+
+    pane.object = None
+    assert model.text == '{}'
+
+    pane.object = b'{"b": 1}'
+    assert model.text == '{"b": 1}'
+
+    pane.object = bytearray(b'{"c": 2}')
+    assert model.text == '{"c": 2}'
+
+
 def test_json_pane_rerenders_on_depth_change(document, comm):
     pane = JSON({'a': 2}, depth=2)
 
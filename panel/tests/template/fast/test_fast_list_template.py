@@ -1,6 +1,5 @@
 import panel as pn
 
-from bokeh.document import Document
 from holoviews import opts
 
 from panel.pane import HoloViews, Markdown
@@ -12,11 +11,11 @@ ACCENT_COLOR = "purple"
 
 opts.defaults(opts.Ellipse(line_width=3, color=ACCENT_COLOR))
 
-def test_template_theme_parameter():
+def test_template_theme_parameter(document):
     template = FastListTemplate(title="Fast", theme="dark")
     # Not '#3f3f3f' which is for the Vanilla theme
 
-    doc = template.server_doc(Document())
+    doc = template.server_doc(document)
     assert doc.theme._json['attrs']['Figure']['background_fill_color']=="#181818"
 
     assert isinstance(template._get_theme(), FastListDarkTheme)
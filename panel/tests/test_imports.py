@@ -0,0 +1,96 @@
+"""
+Tests the lazy loading of the top-level panel namespace
+"""
+import subprocess
+import sys
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True
+    )
+
+
+def test_import_panel_is_lazy():
+    result = _run(
+        "import sys; import panel; "
+        "assert 'panel.widgets' not in sys.modules; "
+        "assert 'panel.template' not in sys.modules"
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_lazy_attribute_access():
+    import panel as pn
+    from panel.layout import Column
+    from panel.template import Template
+
+    assert pn.Column is Column
+    assert pn.Template is Template
+    assert 'Column' in dir(pn)
+
+    for name in ('compiler', 'io', 'models', 'reactive', 'util', 'viewable'):
+        assert getattr(pn, name) is sys.modules[f'panel.{name}']
+        assert name in dir(pn)
+
+    result = _run(
+        "import panel as pn; "
+        "pn.reactive.ReactiveHTML; pn.viewable.Viewer; pn.models; "
+        "pn.io; pn.util; pn.compiler"
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_depends_and_interact_not_shadowed_by_submodules():
+    result = _run(
+        "import panel as pn; import panel.depends, panel.interact; "
+        "from panel.depends import depends; "
+        "from panel.interact import interact; "
+        "assert pn.depends is depends; assert pn.interact is interact"
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_submodule_imported_first():
+    result = _run(
+        "from panel.links import Link; from panel.depends import bind; "
+        "from panel.layout import Row; Row(lambda: 1).get_root()"
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_pane_types_outside_pane_module_registered():
+    result = _run(
+        "import param\n"
+        "from panel.pane import PaneBase\n"
+        "class P(param.Parameterized):\n"
+        "    def view(self): return 1\n"
+        "assert PaneBase.get_pane_type(lambda: 1).__name__ == 'interactive'\n"
+        "assert PaneBase.get_pane_type(P().view).__name__ == 'ParamMethod'"
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_extension_template_resolved_lazily():
+    result = _run(
+        "import panel as pn\n"
+        "pn.extension(template='fast')\n"
+        "from panel.template import FastListTemplate, MaterialTemplate\n"
+        "assert pn.config.template is FastListTemplate\n"
+        "pn.config.template = 'material'\n"
+        "assert pn.config.template is MaterialTemplate"
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_extension_applies_signatures_to_lazy_components():
+    result = _run(
+        "import inspect\n"
+        "import panel as pn\n"
+        "pn.extension()\n"
+        "params = inspect.signature(pn.widgets.Button).parameters\n"
+        "assert 'value' in params and 'disabled' in params\n"
+        "assert 'objects' in inspect.signature(pn.Column).parameters\n"
+        "assert 'object' in inspect.signature(pn.pane.Markdown).parameters"
+    )
+    assert result.returncode == 0, result.stderr
@@ -1,12 +1,10 @@
-from functools import partial
-
 import bokeh.core.properties as bp
 import param
 import pytest
 
 from bokeh.models import Div
 from panel.layout import Tabs, WidgetBox
-from panel.reactive import Reactive, ReactiveHTML
+from panel.reactive import Reactive, ReactiveHTML, _PropertyChangeCallback
 from panel.viewable import Viewable
 from panel.widgets import Checkbox, StaticText, TextInput, IntInput
 
@@ -60,9 +58,9 @@ def test_link_properties_nb(document, comm):
 
     # Assert callback is set up correctly
     cb = div._callbacks['text'][0]
-    assert isinstance(cb, partial)
-    assert cb.args == (document, div.ref['id'], comm, None)
-    assert cb.func == obj._comm_change
+    assert isinstance(cb, _PropertyChangeCallback)
+    assert cb.obj is obj
+    assert (cb.doc, cb.ref, cb.comm, cb.subpath) == (document, div.ref['id'], comm, None)
 
 
 def test_link_properties_server(document):
@@ -80,9 +78,9 @@ def test_link_properties_server(document):
 
     # Assert callback is set up correctly
     cb = div._callbacks['text'][0]
-    assert isinstance(cb, partial)
-    assert cb.args == (document, div.ref['id'], None)
-    assert cb.func == obj._server_change
+    assert isinstance(cb, _PropertyChangeCallback)
+    assert cb.obj is obj
+    assert (cb.doc, cb.ref, cb.comm, cb.subpath) == (document, div.ref['id'], None, None)
 
 
 def test_text_input_controls():
@@ -367,6 +365,15 @@ def test_reactive_html_templated_children_add_loop_id():
     model = test.get_root()
     assert model.looped == ['option']
 
+    test.children = ['A']
+    assert test._get_template() == """
+        <select id="select-${id}">
+        
+          <option id="option-0-${id}"></option>
+        
+        </select>
+        """
+
 
 
 def test_reactive_html_templated_children_add_loop_id_and_for_loop_var():
@@ -30,6 +30,20 @@ def test_button_event(document, comm):
     assert button.value == False
 
 
+def test_button_on_click_unwatch():
+    button = Button(name='Button')
+
+    clicks = []
+    watcher = button.on_click(lambda event: clicks.append(event.new))
+
+    button.clicks += 1
+    assert clicks == [1]
+
+    button.param.unwatch(watcher)
+    button.clicks += 1
+    assert clicks == [1]
+
+
 def test_button_jscallback_clicks(document, comm):
     button = Button(name='Button')
     code = 'console.log("Clicked!")'
@@ -43,6 +57,14 @@ def test_button_jscallback_clicks(document, comm):
     assert code in callbacks['button_click'][0].code
 
 
+def test_button_jscallback_clicks_renames_key():
+    button = Button(name='Button')
+    code = 'console.log("Clicked!")'
+    callback = button.jscallback(clicks=code)
+
+    assert callback.code == {'event:button_click': code}
+
+
 def test_toggle(document, comm):
     toggle = Toggle(name='Toggle', value=True)
 
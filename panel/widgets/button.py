@@ -2,6 +2,8 @@
 Defines Button and button-like widgets which allow triggering events
 or merely toggling between on-off states.
 """
+import sys
+
 from functools import partial
 
 import param
@@ -32,13 +34,20 @@ class _ClickButton(_ButtonBase):
 
     _event = 'button_click'
 
+    # Name of the bokeh event triggered by a click, computed per class
+    _event_key = 'event:button_click'
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._event_key = sys.intern('event:'+cls._event)
+
     def _get_model(self, doc, root=None, parent=None, comm=None):
         model = super()._get_model(doc, root, parent, comm)
         ref = (root or model).ref['id']
         model.on_click(partial(self._server_click, doc, ref))
         return model
 
-    def js_on_click(self, args={}, code=""):
+    def js_on_click(self, args=None, code=""):
         """
         Allows defining a JS callback to be triggered when the button
         is clicked.
@@ -56,9 +65,10 @@ class _ClickButton(_ButtonBase):
           The Callback which can be used to disable the callback.
         """
         from ..links import Callback
-        return Callback(self, code={'event:'+self._event: code}, args=args)
+        args = {} if args is None else args
+        return Callback(self, code={self._event_key: code}, args=args)
 
-    def jscallback(self, args={}, **callbacks):
+    def jscallback(self, args=None, **callbacks):
         """
         Allows defining a JS callback to be triggered when a property
         changes on the source object. The keyword arguments define the
@@ -79,10 +89,13 @@ class _ClickButton(_ButtonBase):
           The Callback which can be used to disable the callback.
         """
         from ..links import Callback
-        for k, v in list(callbacks.items()):
-            if k == 'clicks':
-                k = 'event:'+self._event
-            callbacks[k] = self._rename.get(v, v)
+        args = {} if args is None else args
+        event = self._event_key
+        rename = self._rename
+        callbacks = {
+            event if k == 'clicks' else k: rename.get(v, v)
+            for k, v in callbacks.items()
+        }
         return Callback(self, code=callbacks, args=args)
 
 
@@ -103,7 +116,7 @@ class Button(_ClickButton):
         return super()._linkable_params + ['value']
 
     def jslink(self, target, code=None, args=None, bidirectional=False, **links):
-        links = {'event:'+self._event if p == 'value' else p: v for p, v in links.items()}
+        links = {self._event_key if p == 'value' else p: v for p, v in links.items()}
         super().jslink(target, code, args, bidirectional, **links)
 
     jslink.__doc__ = Widget.jslink.__doc__
@@ -125,7 +138,23 @@ class Button(_ClickButton):
         return msg
 
     def on_click(self, callback):
-        self.param.watch(callback, 'clicks', onlychanged=False)
+        """
+        Register a callback to be executed when the Button is clicked.
+        The callback is given an Event argument declaring the number
+        of clicks.
+
+        Arguments
+        ---------
+        callback: (callable)
+            The function to run on click events.
+
+        Returns
+        -------
+        watcher: param.parameterized.Watcher
+          The Watcher, which can be passed to param.unwatch to remove
+          the callback.
+        """
+        return self.param.watch(callback, 'clicks', onlychanged=False)
 
 
 class Toggle(_ButtonBase):
@@ -163,7 +192,23 @@ class MenuButton(_ClickButton):
     _event = 'menu_item_click'
 
     def on_click(self, callback):
-        self.param.watch(callback, 'clicked', onlychanged=False)
+        """
+        Register a callback to be executed when the MenuButton or one
+        of its menu items is clicked. The callback is given an Event
+        argument declaring the clicked item.
+
+        Arguments
+        ---------
+        callback: (callable)
+            The function to run on click events.
+
+        Returns
+        -------
+        watcher: param.parameterized.Watcher
+          The Watcher, which can be passed to param.unwatch to remove
+          the callback.
+        """
+        return self.param.watch(callback, 'clicked', onlychanged=False)
 
     def _server_click(self, doc, ref, event):
         processing = bool(self._events)
@@ -17,7 +17,6 @@ from bokeh.models.widgets.tables import (
 from bokeh.util.serialization import convert_datetime_array
 from pyviz_comms import JupyterComm
 
-from ..depends import param_value_if_widget
 from ..io.resources import LOCAL_DIST, set_resource_mode
 from ..io.state import state
 from ..reactive import ReactiveData
@@ -375,6 +374,7 @@ class BaseTable(ReactiveData, Widget):
         elif isinstance(filter, (FunctionType, MethodType)):
             deps = list(filter._dinfo['kw'].values()) if hasattr(filter, '_dinfo') else []
         else:
+            from ..depends import param_value_if_widget
             filter = param_value_if_widget(filter)
             if not isinstance(filter, param.Parameter):
                 raise ValueError(f'{type(self).__name__} filter must be '